@@ -8,178 +8,350 @@ Designed to run on Synology NAS for automated backups.
 
 import argparse
 import datetime
+import json
 import logging
 import os
+import re
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+GITHUB_API_URL = 'https://api.github.com'
+REPOS_PER_PAGE = 100
+
+# Bumped when older .state.json contents can no longer be trusted
+STATE_VERSION = 2
+
+# Git arguments shared by every backup
+GIT_OPTIONS = ("-c", "protocol.version=2")
+CLONE_ARGS = ("clone", "--mirror", "--quiet")
+PARTIAL_CLONE_ARGS = CLONE_ARGS + ("--filter=blob:none",)
+UPDATE_ARGS = ("remote", "update", "--prune")
+
+# Answers git's credential prompts with the token from the environment
+ASKPASS_SCRIPT = """#!/bin/sh
+case "$1" in
+    Username*) echo "x-access-token" ;;
+    *) echo "$GITHUB_TOKEN" ;;
+esac
+"""
 
-import yaml
-from github import Github, GithubException
+# Credentials embedded in an https remote URL, as older backups were cloned with
+EMBEDDED_CREDENTIALS = re.compile(r'https://[^/@\s]+@')
 
-# Setup argument parser
-parser = argparse.ArgumentParser(description='Backup GitHub repositories')
-parser.add_argument('--config', default='config.yaml', help='Path to config file')
-parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
-args = parser.parse_args()
+# Environment for git processes, completed with credentials in main()
+git_env = dict(os.environ, GIT_TERMINAL_PROMPT='0')
 
-# Load configuration
-try:
-    with open(args.config, 'r') as config_file:
-        config = yaml.safe_load(config_file)
-except Exception as e:
-    print(f"Error loading configuration: {e}")
-    sys.exit(1)
+logger = logging.getLogger('github_backup')
 
-# Setup logging
-log_dir = Path(config['backup'].get('path', '.')) / 'logs'
-os.makedirs(log_dir, exist_ok=True)
+# Set by setup()
+config = None
+log_dir = None
 
-log_file = log_dir / f"github_backup_{datetime.datetime.now().strftime('%Y%m%d')}.log"
-log_level = logging.DEBUG if args.verbose else logging.INFO
+def setup():
+    """Parse command line arguments, load the configuration and configure logging."""
+    global config, log_dir
 
-# Configure logger
-logger = logging.getLogger('github_backup')
-logger.setLevel(log_level)
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description='Backup GitHub repositories')
+    parser.add_argument('--config', default='config.yaml', help='Path to config file')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
+    args = parser.parse_args()
+
+    # Imported here so --help doesn't pay for it
+    import yaml
+
+    # Load configuration
+    try:
+        with open(args.config, 'r') as config_file:
+            config = yaml.safe_load(config_file)
+    except Exception as e:
+        print(f"Error loading configuration: {e}")
+        sys.exit(1)
+
+    # Setup logging
+    log_dir = Path(config['backup'].get('path', '.')) / 'logs'
+    os.makedirs(log_dir, exist_ok=True)
+
+    log_file = log_dir / f"github_backup_{datetime.datetime.now().strftime('%Y%m%d')}.log"
+    log_level = logging.DEBUG if args.verbose else logging.INFO
 
-# File handler with rotation
-file_handler = RotatingFileHandler(
-    log_file,
-    maxBytes=10*1024*1024,  # 10MB
-    backupCount=5
-)
-file_handler.setLevel(log_level)
+    # Configure logger
+    logger.setLevel(log_level)
 
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(log_level)
+    # File handler with rotation
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5
+    )
+    file_handler.setLevel(log_level)
 
-# Formatter
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(log_level)
 
-# Add handlers to logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+    # Formatter
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+
+    # Add handlers to logger
+    logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
 
 def cleanup_old_logs():
     """Remove log files older than the configured retention period."""
     retention_days = config['backup'].get('log_retention_days', 30)
-    cutoff_date = datetime.datetime.now() - datetime.timedelta(days=retention_days)
+    cutoff_ts = (datetime.datetime.now() - datetime.timedelta(days=retention_days)).timestamp()
+
+    # scandir entries carry their file type, so only the mtime needs a stat call
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if '.log' not in entry.name or not entry.is_file():
+                continue
+            if entry.stat().st_mtime < cutoff_ts:
+                try:
+                    logger.debug(f"Removing old log file: {entry.path}")
+                    os.remove(entry.path)
+                except Exception as e:
+                    logger.error(f"Failed to remove old log file {entry.path}: {e}")
 
-    for log_file in log_dir.glob('*.log*'):
-        file_time = datetime.datetime.fromtimestamp(log_file.stat().st_mtime)
-        if file_time < cutoff_date:
-            try:
-                logger.debug(f"Removing old log file: {log_file}")
-                os.remove(log_file)
-            except Exception as e:
-                logger.error(f"Failed to remove old log file {log_file}: {e}")
+class RateLimitExceeded(Exception):
+    """Raised when the GitHub API rate limit has been used up."""
 
-def backup_repository(repo, backup_path):
-    """Backup a single repository or update an existing backup."""
-    repo_path = os.path.join(backup_path, repo.name)
+def create_session(token):
+    """Create a GitHub API session that reuses connections and retries transient errors."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Authorization': f"token {token}",
+        'Accept': 'application/vnd.github+json',
+        'Accept-Encoding': 'gzip',
+    })
+    return session
+
+def estimate_api_requests(cache_dir):
+    """Estimate the API requests needed to list all organizations, based on cached page counts."""
+    needed = 1  # Connection check
+    for org_name in config['organizations']:
+        try:
+            with open(cache_dir / f"{org_name}.json", 'r') as f:
+                needed += max(1, len(json.load(f)))
+        except (OSError, ValueError):
+            needed += 1
+    return needed
+
+def wait_for_rate_limit(session, needed):
+    """Sleep until the rate limit resets if fewer than the needed requests remain."""
+    # Querying /rate_limit does not count against the rate limit
+    response = session.get(f"{GITHUB_API_URL}/rate_limit", timeout=30)
+    response.raise_for_status()
+    core = response.json()['resources']['core']
+    logger.debug(f"API rate limit: {core['remaining']}/{core['limit']} remaining, need ~{needed}")
+
+    if core['remaining'] < needed:
+        wait_seconds = max(0, core['reset'] - time.time()) + 1
+        logger.warning(
+            f"Only {core['remaining']} API requests remaining, "
+            f"waiting {wait_seconds / 60:.1f} minutes for the rate limit to reset"
+        )
+        time.sleep(wait_seconds)
+
+def create_askpass_script():
+    """Write the GIT_ASKPASS helper script to a private temporary file and return its path."""
+    fd, path = tempfile.mkstemp(prefix='github_backup_askpass_', suffix='.sh')
+    with os.fdopen(fd, 'w') as f:
+        f.write(ASKPASS_SCRIPT)
+    os.chmod(path, 0o700)
+    return path
+
+def write_json_atomic(path, data):
+    """Write data as JSON to path, replacing any existing file atomically."""
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path), delete=False) as tmp_file:
+        json.dump(data, tmp_file)
+    os.replace(tmp_file.name, path)
+
+def get_repo_page(session, url, cached):
+    """
+    Fetch one page of an organization's repository list.
+
+    Returns the page's ETag, its repositories and the number of the last page.
+    If the cached ETag still matches, GitHub answers 304 and the cached page is returned.
+    """
+    # Entries written before the last page number was cached can't be reused
+    if cached and cached.get('etag') and 'last' in cached:
+        headers = {'If-None-Match': cached['etag']}
+    else:
+        headers = {}
+    response = session.get(url, headers=headers, timeout=30)
+
+    if response.status_code == 304:
+        logger.debug(f"Repository list unchanged: {url}")
+        return cached
+
+    if response.status_code in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+        raise RateLimitExceeded(f"rate limit exceeded while fetching {url}")
+    response.raise_for_status()
+
+    last_url = response.links.get('last', {}).get('url')
+    if last_url:
+        last_page = int(parse_qs(urlparse(last_url).query)['page'][0])
+    else:
+        # The last page itself has no rel="last" link
+        last_page = int(parse_qs(urlparse(url).query).get('page', ['1'])[0])
+
+    return {
+        'etag': response.headers.get('ETag'),
+        'repos': [
+            {
+                'name': r['name'],
+                'full_name': r['full_name'],
+                'clone_url': r['clone_url'],
+                'default_branch': r.get('default_branch'),
+                'pushed_at': r.get('pushed_at'),
+            }
+            for r in response.json()
+        ],
+        'last': last_page,
+    }
+
+def get_org_repos(session, org_name, cache_dir):
+    """
+    List the repositories of an organization.
+
+    The first page gives the page count from its Link header; the remaining
+    pages are then fetched in parallel. If the last page is full, following
+    pages are requested until a short one, since a cached page count can miss
+    a page added behind an unchanged first page. Each page's ETag is cached under
+    cache_dir and sent back with If-None-Match, so unchanged pages come back
+    as 304 Not Modified, which costs no rate limit.
+    """
+    cache_file = cache_dir / f"{org_name}.json"
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    base_url = f"{GITHUB_API_URL}/orgs/{org_name}/repos?per_page={REPOS_PER_PAGE}"
+    first_page = get_repo_page(session, base_url, cache.get(base_url))
+    pages = {base_url: first_page}
+
+    last_page = first_page['last']
+    urls = [f"{base_url}&page={n}" for n in range(2, last_page + 1)]
+    if urls:
+        max_workers = min(len(urls), config['backup'].get('max_workers', 8))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(get_repo_page, session, url, cache.get(url)) for url in urls]
+            for url, future in zip(urls, futures):
+                pages[url] = future.result()
+
+    url = urls[-1] if urls else base_url
+    while len(pages[url]['repos']) == REPOS_PER_PAGE:
+        last_page += 1
+        url = f"{base_url}&page={last_page}"
+        pages[url] = get_repo_page(session, url, cache.get(url))
 
-    # Construct authenticated clone URL
-    token = config['github']['token']
-    # Extract the base URL without the https:// prefix
-    base_url = repo.clone_url.replace('https://', '')
-    # Construct authenticated URL
-    authenticated_url = f"https://{token}@{base_url}"
+    try:
+        write_json_atomic(cache_file, pages)
+    except OSError as e:
+        logger.warning(f"Failed to write repository list cache {cache_file}: {e}")
+
+    return [repo for page in pages.values() for repo in page['repos']]
+
+def run_git(cwd, *args):
+    """
+    Run a git command in cwd, raising CalledProcessError on failure.
+
+    Output is discarded; stderr is kept, decoded as UTF-8, for error reporting.
+    """
+    return subprocess.run(
+        ("git", "-C", cwd, *GIT_OPTIONS, *args),
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        text=True, encoding='utf-8', errors='replace', env=git_env
+    )
+
+def has_embedded_credentials(repo_path):
+    """Check whether a mirror's config has credentials embedded in a remote URL."""
+    config_file = Path(repo_path) / 'config'
+    return config_file.exists() and EMBEDDED_CREDENTIALS.search(config_file.read_text()) is not None
+
+def head_matches(repo_path, default_branch):
+    """Check whether a mirror's HEAD points at the given default branch."""
+    head_file = Path(repo_path) / 'HEAD'
+    if not default_branch or not head_file.exists():
+        return True
+    return head_file.read_text().strip() == f"ref: refs/heads/{default_branch}"
+
+def is_backup_current(repo, repo_path, state):
+    """
+    Check whether a repository's backup needs no work at all.
+
+    That is the case when nothing was pushed since its last successful backup
+    and its mirror needs no config fixes either.
+    """
+    return bool(
+        repo['pushed_at'] and state.get(repo['full_name']) == repo['pushed_at']
+        and os.path.exists(repo_path)
+        and head_matches(repo_path, repo['default_branch'])
+        and not has_embedded_credentials(repo_path)
+    )
+
+def backup_repository(repo_name, clone_url, default_branch, backup_path):
+    """Backup a single repository or update an existing backup."""
+    repo_path = os.path.join(backup_path, repo_name)
 
     try:
         if os.path.exists(repo_path):
             # Update existing repository
-            logger.info(f"Updating existing repository: {repo.name}")
-            os.chdir(repo_path)
+            # Older backups were cloned with the token embedded in the remote URL
+            if has_embedded_credentials(repo_path):
+                logger.info(f"Removing embedded credentials from remote URL of {repo_name}")
+                run_git(repo_path, "remote", "set-url", "origin", clone_url)
 
-            # For mirror repositories
-            is_mirror = False
-            try:
-                # Check if this is a mirror repository by looking for the '--mirror' config
-                result = subprocess.run(
-                    ["git", "config", "--get", "remote.origin.mirror"],
-                    check=False, capture_output=True, text=True
-                )
-                is_mirror = result.stdout.strip() == "true"
-            except Exception:
-                pass
-
-            logger.debug(f"Repository is mirror: {is_mirror}")
-
-            # Fetch updates
-            logger.debug(f"Fetching updates for {repo.name}")
-            subprocess.run(["git", "fetch", "--all"], check=True, capture_output=True)
-
-            if is_mirror:
-                # For mirror repositories, just fetch everything
-                logger.debug("Mirror repository: just fetching all refs")
-                subprocess.run(["git", "fetch", "--prune"], check=True, capture_output=True)
-                subprocess.run(["git", "fetch", "--tags", "--force"], check=True, capture_output=True)
-            else:
-                # For regular repositories, we need to reset to a branch
-                # Detect default branch
-                default_branch = repo.default_branch
-                logger.debug(f"Repository default branch: {default_branch}")
+            # Follow default branch changes on GitHub; HEAD is only set when cloning
+            if not head_matches(repo_path, default_branch):
+                logger.info(f"Default branch of {repo_name} changed, pointing HEAD to {default_branch}")
+                run_git(repo_path, "symbolic-ref", "HEAD", f"refs/heads/{default_branch}")
 
-                # Reset to default branch
-                try:
-                    logger.debug(f"Attempting to reset to origin/{default_branch}")
-                    subprocess.run(["git", "reset", "--hard", f"origin/{default_branch}"],
-                                   check=True, capture_output=True)
-                except subprocess.CalledProcessError as e:
-                    logger.warning(f"Could not reset to origin/{default_branch}, trying to find available branches")
-
-                    # Get list of remote branches
-                    result = subprocess.run(["git", "branch", "-r"], check=True,
-                                            capture_output=True, text=True)
-                    remote_branches = result.stdout.strip().split('\n')
-                    remote_branches = [b.strip() for b in remote_branches if b.strip()]
-
-                    logger.debug(f"Available remote branches: {remote_branches}")
-
-                    # Try main, then master, then any other branch
-                    branch = None
-                    if not remote_branches:
-                        logger.warning("No remote branches found, skipping reset")
-                    else:
-                        if any(b.endswith("/main") for b in remote_branches):
-                            branch = next(b for b in remote_branches if b.endswith("/main"))
-                        elif any(b.endswith("/master") for b in remote_branches):
-                            branch = next(b for b in remote_branches if b.endswith("/master"))
-                        elif remote_branches:
-                            # Get the first available branch
-                            branch = remote_branches[0]
-
-                        if branch:
-                            logger.info(f"Resetting to {branch}")
-                            subprocess.run(["git", "reset", "--hard", branch], check=True, capture_output=True)
-
-                # Pull all branches and tags
-                subprocess.run(["git", "pull", "--all"], check=True, capture_output=True)
-                subprocess.run(["git", "fetch", "--tags"], check=True, capture_output=True)
+            logger.info(f"Updating existing repository: {repo_name}")
+
+            # Backups are always mirror clones, so fetching every ref is all that's needed
+            logger.debug(f"Fetching updates for {repo_name}")
+            run_git(repo_path, *UPDATE_ARGS)
 
         else:
             # Clone new repository
-            logger.info(f"Cloning new repository: {repo.name}")
+            logger.info(f"Cloning new repository: {repo_name}")
             # Use mirror clone to get all branches and refs
-            subprocess.run(
-                ["git", "clone", "--mirror", authenticated_url, repo_path],
-                check=True, capture_output=True
-            )
+            # Partial clones skip blob download; blobs are fetched on demand when first read
+            clone_args = PARTIAL_CLONE_ARGS if config['backup'].get('partial_clone', False) else CLONE_ARGS
+            run_git(backup_path, *clone_args, clone_url, repo_name)
 
-        logger.info(f"Successfully backed up: {repo.name}")
+        logger.info(f"Successfully backed up: {repo_name}")
         return True
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"Git operation failed for {repo.name}: {e}")
-        logger.error(f"Command output: {e.stdout.decode() if e.stdout else ''}")
-        logger.error(f"Command error: {e.stderr.decode() if e.stderr else ''}")
+        logger.error(f"Git operation failed for {repo_name}: {e}")
+        logger.error(f"Command error: {e.stderr}")
         return False
     except Exception as e:
-        logger.error(f"Failed to backup repository {repo.name}: {e}")
+        logger.error(f"Failed to backup repository {repo_name}: {e}")
         return False
 
 def send_heartbeat_ping():
@@ -200,11 +372,30 @@ def send_heartbeat_ping():
 
 def main():
     """Main backup process."""
+    setup()
+
+    # Third-party imports are deferred until the configuration has loaded
+    import requests
+    from github import Github, GithubException
+
     start_time = datetime.datetime.now()
     logger.info("Starting GitHub repository backup")
 
-    # Connect to GitHub API
     try:
+        # Create backup directory if it doesn't exist
+        backup_path = config['backup']['path']
+        os.makedirs(backup_path, exist_ok=True)
+
+        # Repository listings are fetched directly from the REST API so pages can be cached
+        cache_dir = Path(backup_path) / '.gh_cache'
+        os.makedirs(cache_dir, exist_ok=True)
+
+        session = create_session(config['github']['token'])
+
+        # Make sure the run won't run out of API requests halfway through
+        wait_for_rate_limit(session, estimate_api_requests(cache_dir))
+
+        # Connect to GitHub API
         g = Github(config['github']['token'])
 
         # Test connection
@@ -215,37 +406,94 @@ def main():
         total_repos = 0
         successful_backups = 0
         failed_backups = 0
+        skipped_backups = 0
+
+        # pushed_at of each repository as of its last successful backup
+        state_file = Path(backup_path) / '.state.json'
+        try:
+            with open(state_file, 'r') as f:
+                saved_state = json.load(f)
+        except (OSError, ValueError):
+            saved_state = {}
+        if saved_state.get('version') == STATE_VERSION:
+            state = saved_state['repos']
+        else:
+            # Unversioned state could record skips that never actually fetched
+            if saved_state:
+                logger.info("Discarding outdated backup state, all repositories will be updated")
+            state = {}
 
-        # Create backup directory if it doesn't exist
-        backup_path = config['backup']['path']
-        os.makedirs(backup_path, exist_ok=True)
+        # Collect (repo, org_path) pairs across all organizations
+        tasks = []
+        # A repository can be listed twice (an organization configured twice, or a repository
+        # shifting between pages while they are fetched); two workers must never share a path
+        seen_repos = set()
 
         # Process each organization
         for org_name in config['organizations']:
             try:
                 logger.info(f"Processing organization: {org_name}")
 
-                # Get organization and its repositories
-                org = g.get_organization(org_name)
-                repos = org.get_repos()
+                # Get organization repositories
+                repos = get_org_repos(session, org_name, cache_dir)
 
                 # Create organization directory
                 org_path = os.path.join(backup_path, org_name)
                 os.makedirs(org_path, exist_ok=True)
 
-                # Backup each repository
+                # Queue each repository for backup, unless its backup is already current
                 for repo in repos:
+                    if repo['full_name'] in seen_repos:
+                        continue
+                    seen_repos.add(repo['full_name'])
                     total_repos += 1
+                    if is_backup_current(repo, os.path.join(org_path, repo['name']), state):
+                        logger.debug(f"Repository unchanged since last backup: {repo['name']}")
+                        skipped_backups += 1
+                        continue
+                    tasks.append((repo, org_path))
+
+            except RateLimitExceeded as e:
+                # Further API calls would fail too; back up what has been listed so far
+                logger.error(f"GitHub API error: {e}, skipping remaining organizations")
+                break
+            except requests.RequestException as e:
+                logger.error(f"GitHub API error for organization {org_name}: {e}")
+            except Exception as e:
+                logger.error(f"Error processing organization {org_name}: {e}")
 
-                    if backup_repository(repo, org_path):
+        # Backup repositories concurrently; git work is almost entirely I/O-bound.
+        # Stats and state are only updated here in the main thread as futures complete.
+        max_workers = config['backup'].get('max_workers', 8)
+        logger.info(f"Backing up {len(tasks)} repositories with {max_workers} workers")
+
+        # git asks for credentials through GIT_ASKPASS, keeping the token out of remote URLs
+        askpass_path = create_askpass_script()
+        git_env.update({'GIT_ASKPASS': askpass_path, 'GITHUB_TOKEN': config['github']['token']})
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        backup_repository,
+                        repo['name'], repo['clone_url'], repo['default_branch'], org_path
+                    ): repo
+                    for repo, org_path in tasks
+                }
+                for future in as_completed(futures):
+                    # backup_repository only returns True once git has run and succeeded
+                    if future.result():
                         successful_backups += 1
+                        repo = futures[future]
+                        state[repo['full_name']] = repo['pushed_at']
                     else:
                         failed_backups += 1
+        finally:
+            os.remove(askpass_path)
 
-            except GithubException as e:
-                logger.error(f"GitHub API error for organization {org_name}: {e}")
-            except Exception as e:
-                logger.error(f"Error processing organization {org_name}: {e}")
+        try:
+            write_json_atomic(state_file, {'version': STATE_VERSION, 'repos': state})
+        except OSError as e:
+            logger.warning(f"Failed to write backup state {state_file}: {e}")
 
         # Log summary
         end_time = datetime.datetime.now()
@@ -256,6 +504,7 @@ def main():
         logger.info("=" * 50)
         logger.info(f"Total repositories found: {total_repos}")
         logger.info(f"Successfully backed up: {successful_backups}")
+        logger.info(f"Skipped (unchanged): {skipped_backups}")
         logger.info(f"Failed backups: {failed_backups}")
         logger.info(f"Backup duration: {duration:.2f} minutes")
         logger.info("=" * 50)
@@ -267,6 +516,13 @@ def main():
 
     except GithubException as e:
         logger.error(f"GitHub API error: {e}")
+    except requests.RequestException as e:
+        # Only the startup rate limit check lets these through; as the first API call,
+        # it is also where a bad or expired token shows up
+        if e.response is not None:
+            logger.error(f"GitHub API error: {e.response.status_code} {e.response.text}")
+        else:
+            logger.error(f"GitHub API error: {e}")
     except Exception as e:
         logger.error(f"Unhandled exception: {e}")
 